@@ -0,0 +1,44 @@
+import importlib
+import json
+import re
+import sys
+import urllib.parse
+from pathlib import Path
+
+# Корень репозитория является пакетом (``vk`` импортирует ``..required_params``),
+# поэтому модуль импортируется по имени каталога репозитория.
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT.parent))
+vk = importlib.import_module(f'{ROOT.name}.vk.vk')
+
+
+class FakeResponse:
+
+    def __init__(self, body, status_code=200):
+        self.content = json.dumps(body).encode()
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Сессия, которая вместо отправки запроса возвращает имя вызванного метода (для ``execute`` — список)."""
+
+    def __init__(self, body=None):
+        self.body = body
+        self.requests = []
+
+    def request(self, method, url, data=None, timeout=None):
+        self.requests.append((method, url, data))
+        if self.body is not None:
+            return FakeResponse(self.body)
+        if data is None:
+            return FakeResponse({'response': urllib.parse.urlsplit(url).path.rsplit('/', 1)[-1]})
+        return FakeResponse({'response': re.findall(r'API\.([\w.]+)\(', data['code'])})
+
+    def close(self):
+        pass
+
+    def tokens(self):
+        return [
+            urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)['access_token'][0]
+            for _, url, _ in self.requests
+        ]
@@ -0,0 +1,35 @@
+import unittest
+
+from fakes import FakeSession, vk
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = vk.VkApi(-1, 'user-token', 'group-token', cache_size=8)
+        self.api._session = FakeSession()
+
+    def test_repeated_call_hits_cache(self):
+        self.api.get_users_info(params={'users_id': 1})
+        self.api.get_users_info(params={'users_id': 1})
+
+        self.assertEqual(len(self.api._session.requests), 1)
+
+    def test_token_and_owner_change_miss_cache(self):
+        self.api.get_users_info(params={'users_id': 1})
+        self.api.token = 'other-token'
+        self.api.get_users_info(params={'users_id': 1})
+        self.api.owner_id = -2
+        self.api.get_users_info(params={'users_id': 1})
+
+        self.assertEqual(len(self.api._session.requests), 3)
+
+    def test_hit_returns_copy(self):
+        first = self.api.get_users_info(params={'users_id': 1})
+        first.body['response'] = 'changed'
+
+        self.assertEqual(self.api.get_users_info(params={'users_id': 1}).body, {'response': 'users.get'})
+
+
+if __name__ == '__main__':
+    unittest.main()
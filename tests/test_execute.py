@@ -0,0 +1,122 @@
+import threading
+import unittest
+import urllib.parse
+
+from fakes import FakeSession, vk
+
+
+class ExecuteTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = vk.VkApi(-1, 'user-token', 'group-token')
+        self.api._session = FakeSession()
+
+    def test_execute_code(self):
+        code = self.api._get_execute_code([('wall.get', {'count': 1}), ('users.get', {'user_ids': 'тест'})])
+
+        self.assertEqual(
+            code,
+            'return [API.wall.get({"owner_id": -1, "count": 1}), '
+            'API.users.get({"owner_id": -1, "user_ids": "тест"})];'
+        )
+
+    def test_code_is_sent_in_body(self):
+        self.api.execute([('wall.get', {})])
+
+        method, url, data = self.api._session.requests[0]
+        self.assertEqual(method, 'POST')
+        self.assertNotIn('code', urllib.parse.urlsplit(url).query)
+        self.assertEqual(data, {'code': 'return [API.wall.get({"owner_id": -1})];'})
+
+    def test_calls_grouped_by_token_in_original_order(self):
+        calls = [
+            ('wall.get', {}),
+            ('messages.send', {'peer_id': 1}),
+            ('wall.getComments', {}),
+            ('groups.getCallbackServers', {}),
+        ]
+
+        responses = self.api.execute(calls)
+
+        self.assertEqual(self.api._session.tokens(), ['user-token', 'group-token'])
+        self.assertEqual([r.body['response'] for r in responses], [method for method, _ in calls])
+
+    def test_calls_chunked_by_limit(self):
+        calls = [('wall.get', {})] * (vk.VkApiMethods.execute_limit + 1)
+
+        responses = self.api.execute(calls)
+
+        self.assertEqual(len(self.api._session.requests), 2)
+        self.assertEqual(len(responses), len(calls))
+
+    def test_false_items_mapped_to_execute_errors(self):
+        errors = [{'method': 'wall.getComments', 'error_code': 15}, {'method': 'users.get', 'error_code': 18}]
+        self.api._session.body = {'response': [False, {'count': 0}, False], 'execute_errors': errors}
+
+        responses = self.api.execute([('wall.getComments', {}), ('wall.get', {}), ('users.get', {})])
+
+        self.assertEqual(
+            [r.body for r in responses],
+            [{'error': errors[0]}, {'response': {'count': 0}}, {'error': errors[1]}]
+        )
+
+    def test_failed_execute_returned_for_every_call(self):
+        error = {'error': {'error_code': 5, 'error_msg': 'User authorization failed'}}
+        self.api._session.body = error
+
+        responses = self.api.execute([('wall.get', {}), ('users.get', {})])
+
+        self.assertEqual([r.body for r in responses], [error, error])
+        responses[0].body['error']['error_code'] = 0
+        self.assertEqual(responses[1].body, error)
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = vk.VkApi(-1, 'user-token', 'group-token')
+        self.api._session = FakeSession()
+
+    def test_flush_on_exit(self):
+        with self.api.batch():
+            result = self.api.get_posts({})
+            self.assertFalse(result.done())
+            self.assertEqual(self.api._session.requests, [])
+
+        self.assertEqual(result.response.body, {'response': 'wall.get'})
+
+    def test_auto_flush_at_limit(self):
+        limit = vk.VkApiMethods.execute_limit
+        with self.api.batch():
+            results = [self.api.get_posts({}) for _ in range(limit)]
+            self.assertEqual(len(self.api._session.requests), 1)
+            self.assertTrue(all(result.done() for result in results))
+            extra = self.api.get_posts({})
+            self.assertFalse(extra.done())
+
+        self.assertEqual(len(self.api._session.requests), 2)
+        self.assertTrue(extra.done())
+
+    def test_nested_batch_restores_outer(self):
+        with self.api.batch():
+            with self.api.batch():
+                inner = self.api.get_posts({})
+            self.assertTrue(inner.done())
+            outer = self.api.get_posts({})
+            self.assertFalse(outer.done())
+
+        self.assertTrue(outer.done())
+
+    def test_batch_does_not_affect_other_threads(self):
+        results = []
+        with self.api.batch():
+            thread = threading.Thread(target=lambda: results.append(self.api.get_posts({})))
+            thread.start()
+            thread.join()
+
+        self.assertIsInstance(results[0], vk.VkApiResponse)
+        self.assertEqual(results[0].body, {'response': 'wall.get'})
+
+
+if __name__ == '__main__':
+    unittest.main()
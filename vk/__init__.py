@@ -1 +1,7 @@
 from .vk import VkApi
+
+try:
+    from .async_vk import AsyncVkApi
+except ModuleNotFoundError as e:
+    if e.name != 'aiohttp':
+        raise
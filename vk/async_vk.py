@@ -0,0 +1,117 @@
+import asyncio
+from typing import Awaitable, Iterable
+
+import aiohttp
+
+from .methods import VkApiMethods
+from .vk import BaseVkApi, VkApiResponse, json_loads
+
+
+class AsyncVkApi(BaseVkApi):
+    """Асинхронное представление взаимодействия с Api VK.
+
+    Повторяет набор методов :class:`VkApi`, но каждый метод возвращает awaitable объект,
+    что позволяет отправлять несколько запросов одновременно через общий пул соединений.
+    Атрибуты описаны в :class:`BaseVkApi`.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _build_session(self):
+        """Сессия создаётся лениво при первом запросе, т.к. ей требуется запущенный event loop.
+
+        """
+        return None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Метод получения сессии для отправки запросов.
+
+        Returns:
+            :obj:`aiohttp.ClientSession`: Сессия с пулом соединений.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        """Метод закрытия сессии и освобождения пула соединений.
+
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    async def _send_api_request(self, api_method: str, params: dict, data: dict = None):
+        """Метод отправки запроса к Api VK.
+
+        Args:
+            api_method (str): Метод Api VK.
+            params (dict): Параметры запроса.
+            data (dict, optional): Параметры, передаваемые в теле запроса.
+
+        Returns:
+            :obj:`VkApiResponse`: Возвращает объект с телом и кодом ответа.
+        """
+
+        if not VkApiMethods.has_method(api_method):
+            return VkApiResponse(
+                {'response': {
+                    'error': 'Метод не существует'
+                }},
+                404
+            )
+
+        cache_key = self._get_cache_key(api_method, params)
+        if cache_key is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cached
+
+        url = self._get_url(api_method, params=params)
+        async with self._get_session().request(VkApiMethods.get_http_method(api_method), url, data=data) as response:
+            try:
+                response_body = json_loads(await response.read())
+            except ValueError:
+                return VkApiResponse(
+                    {'response': {
+                         'error': 'Сервер не вернул валидный json.'
+                    }},
+                    502
+                )
+
+        api_response = VkApiResponse(response_body, response.status)
+        self._cache_response(cache_key, api_response)
+
+        return api_response
+
+    async def execute(self, calls: list) -> list:
+        """Метод выполнения нескольких методов Api VK одним запросом (см. https://dev.vk.com/method/execute).
+
+        Пакеты по ``VkApiMethods.execute_limit`` запросов отправляются одновременно,
+        отдельно для методов с токеном пользователя и с токеном сообщества.
+
+        Args:
+            calls (list): Список кортежей ``(api_method, params)``.
+
+        Returns:
+            list: Список объектов :obj:`VkApiResponse` в порядке переданных запросов.
+        """
+        chunks = self._get_execute_chunks(calls)
+        responses = await asyncio.gather(*(self._send_execute(token, chunk) for _, token, chunk in chunks))
+        return self._collect_execute_responses(len(calls), chunks, responses)
+
+    async def bulk(self, calls: Iterable[Awaitable[VkApiResponse]]) -> list:
+        """Метод одновременного выполнения нескольких запросов.
+
+        Args:
+            calls: Awaitable объекты, полученные из методов класса
+                (например ``[api.get_comments({'post_id': i}) for i in post_ids]``).
+
+        Returns:
+            list: Список объектов :obj:`VkApiResponse` в порядке переданных запросов.
+        """
+        return list(await asyncio.gather(*calls))
@@ -1,26 +1,10 @@
-import requests
 import urllib.parse
-from abc import ABCMeta
 
 
-class VkApiMethodsBase(metaclass=ABCMeta):
-
-    @property
-    def base_url(self) -> str:
-        raise NotImplemented()
-
-    @property
-    def version(self) -> str:
-        raise NotImplemented()
-
-    @property
-    def __http_methods(self) -> dict:
-        raise NotImplemented()
-
-
-class VkApiMethods(VkApiMethodsBase):
+class VkApiMethods:
     base_url = 'https://api.vk.com/method/'
     version = '5.131'
+    execute_limit = 25
 
     CREATE_COMMENT = 'wall.createComment'
     GET_COMMENT = 'wall.getComment'
@@ -40,42 +24,46 @@ class VkApiMethods(VkApiMethodsBase):
     UPLOAD_PHOTO = 'photos.getWallUploadServer'
     SAVE_PHOTO = 'photos.saveWallPhoto'
     SAVE_VIDEO = 'video.save'
-
-    __http_methods = {
-        CREATE_COMMENT: 'POST',
-        GET_COMMENT: 'GET',
-        GET_COMMENTS: 'GET',
-        GET_LIKES: 'GET',
-        GET_REPOSTS: 'GET',
-        GET_CONVERSATIONS: 'GET',
-        GET_HISTORY: 'GET',
-        GET_POSTS: 'GET',
-        GET_USERS_INFO: 'GET',
-        PUBLISH_POST: 'POST',
-        DELETE_POST: 'POST',
-        SEND_MESSAGE: 'POST',
-        GET_CALLBACK_CONFIRMATION_CODE: 'GET',
-        ADD_CALLBACK_SERVER: 'POST',
-        GET_CALLBACK_SERVERS: 'GET',
-        UPLOAD_PHOTO: 'POST',
-        SAVE_PHOTO: 'POST',
-        SAVE_VIDEO: 'POST',
-    }
+    EXECUTE = 'execute'
 
     @classmethod
     def get_http_method(cls, rpc_method) -> str:
-        return cls.__http_methods.get(rpc_method)
+        return _HTTP_METHODS.get(rpc_method)
 
     @classmethod
     def has_method(cls, method) -> bool:
-        return method in cls.__http_methods
+        return method in _HTTP_METHODS
 
     @classmethod
     def get_url(cls, method, params) -> str:
-        url = urllib.parse.urljoin(cls.base_url, method)
-        if not url.endswith('/'):
-            url += '/'
-        req = requests.models.PreparedRequest()
-        req.prepare_url(url, params)
-        url = req.url
-        return url
+        query = urllib.parse.urlencode(
+            {key: value for key, value in params.items() if value is not None},
+            doseq=True,
+            quote_via=urllib.parse.quote
+        )
+        return f'{cls.base_url}{method}?{query}'
+
+
+assert VkApiMethods.base_url.endswith('/'), 'base_url должен заканчиваться на "/"'
+
+_HTTP_METHODS = {
+    VkApiMethods.CREATE_COMMENT: 'POST',
+    VkApiMethods.GET_COMMENT: 'GET',
+    VkApiMethods.GET_COMMENTS: 'GET',
+    VkApiMethods.GET_LIKES: 'GET',
+    VkApiMethods.GET_REPOSTS: 'GET',
+    VkApiMethods.GET_CONVERSATIONS: 'GET',
+    VkApiMethods.GET_HISTORY: 'GET',
+    VkApiMethods.GET_POSTS: 'GET',
+    VkApiMethods.GET_USERS_INFO: 'GET',
+    VkApiMethods.PUBLISH_POST: 'POST',
+    VkApiMethods.DELETE_POST: 'POST',
+    VkApiMethods.SEND_MESSAGE: 'POST',
+    VkApiMethods.GET_CALLBACK_CONFIRMATION_CODE: 'GET',
+    VkApiMethods.ADD_CALLBACK_SERVER: 'POST',
+    VkApiMethods.GET_CALLBACK_SERVERS: 'GET',
+    VkApiMethods.UPLOAD_PHOTO: 'POST',
+    VkApiMethods.SAVE_PHOTO: 'POST',
+    VkApiMethods.SAVE_VIDEO: 'POST',
+    VkApiMethods.EXECUTE: 'POST',
+}
@@ -1,14 +1,26 @@
+import json
 import random
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
 
 import requests
 from dataclasses import dataclass
-from json import JSONDecodeError
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .methods import VkApiMethods
 from ..required_params import check_params
 
 
-@dataclass
+@dataclass(slots=True)
 class VkApiResponse:
     """Типизация возращаемых значений для методов :class:`VkApi`.
 
@@ -20,18 +32,191 @@ class VkApiResponse:
     status_code: int
 
 
-class VkApi:
-    """Представление взаимодействия с Api VK.
+class BatchResult:
+    """Результат запроса, отложенного до отправки пакета (см. :meth:`VkApi.batch`).
+
+    Attributes:
+        response (:obj:`VkApiResponse`, optional): Ответ на запрос. До отправки пакета равен None.
+    """
+
+    def __init__(self):
+        self.response = None
+
+    def done(self) -> bool:
+        return self.response is not None
+
+
+class Batcher:
+    """Накопитель запросов для отправки через метод ``execute``.
+
+    При накоплении ``VkApiMethods.execute_limit`` запросов пакет отправляется автоматически.
+    """
+
+    def __init__(self, api: 'VkApi'):
+        self._api = api
+        self._calls = []
+        self._results = []
+
+    def add(self, api_method: str, params: dict) -> BatchResult:
+        """Метод добавления запроса в пакет.
+
+        Args:
+            api_method (str): Метод Api VK.
+            params (dict): Параметры запроса.
+
+        Returns:
+            :obj:`BatchResult`: Объект, в который будет записан ответ после отправки пакета.
+        """
+        result = BatchResult()
+        self._calls.append((api_method, params))
+        self._results.append(result)
+        if len(self._calls) >= VkApiMethods.execute_limit:
+            self.flush()
+        return result
+
+    def flush(self):
+        """Метод отправки накопленных запросов.
+
+        """
+        if not self._calls:
+            return
+        calls, results = self._calls, self._results
+        self._calls, self._results = [], []
+        for result, response in zip(results, self._api.execute(calls)):
+            result.response = response
+
+
+class ResponseCache:
+    """LRU-кэш ответов Api VK с ограниченным временем жизни записей.
+
+    Кэш хранит собственную копию тела ответа и при каждом попадании возвращает новую копию,
+    поэтому изменение полученного ответа не влияет на последующие попадания.
+    Методы кэша потокобезопасны.
+
+    Attributes:
+        maxsize (int): Максимальное количество записей.
+        ttl (float): Время жизни записи в секундах.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Метод получения ответа из кэша.
+
+        Args:
+            key: Ключ запроса.
+
+        Returns:
+            :obj:`VkApiResponse` (optional): Копия ответа или None, если записи нет или её время жизни истекло.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, body, status_code = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return VkApiResponse(deepcopy(body), status_code)
+
+    def set(self, key, response: VkApiResponse):
+        """Метод сохранения ответа в кэш.
+
+        Args:
+            key: Ключ запроса.
+            response (:obj:`VkApiResponse`): Ответ на запрос.
+        """
+        item = (time.monotonic() + self.ttl, deepcopy(response.body), response.status_code)
+        with self._lock:
+            self._data[key] = item
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class BaseVkApi(metaclass=ABCMeta):
+    """Общая часть синхронного и асинхронного представлений взаимодействия с Api VK.
+
+    Наследуемые классы определяют создание сессии (``_build_session``) и отправку запросов (``_send_api_request``).
 
     Attributes:
         token (str): Токен пользователя.
         owner_id (int): ID страницы для взаимодействия (ID сообществ должен передаваться со знаком "-").
+        timeout (float, optional): Таймаут запроса к Api VK. Передаётся через ``kwargs``.
+        cache_size (int, optional): Размер кэша ответов для методов из ``cached_methods``.
+            По умолчанию кэш отключён. Передаётся через ``kwargs``.
+        cache_ttl (float, optional): Время жизни ответа в кэше в секундах (по умолчанию 60).
+            Передаётся через ``kwargs``.
     """
 
+    cached_methods = frozenset({
+        VkApiMethods.GET_USERS_INFO,
+        VkApiMethods.GET_CALLBACK_CONFIRMATION_CODE,
+        VkApiMethods.GET_CALLBACK_SERVERS,
+    })
+
     def __init__(self, owner_id: str, token: str, group_token: str = None, **kwargs):
         self.token = token
+        self.timeout = kwargs.get('timeout')
         self.owner_id = owner_id
         self.group_token = group_token
+        self._uses_group_token = {}
+        cache_size = kwargs.get('cache_size')
+        self._cache = ResponseCache(cache_size, kwargs.get('cache_ttl', 60)) if cache_size else None
+        self._session = self._build_session()
+
+    @property
+    def owner_id(self):
+        """
+        int: ID страницы для взаимодействия.
+
+        """
+        return self._owner_id
+
+    @owner_id.setter
+    def owner_id(self, val):
+        self._owner_id = val
+        self._group_id = str(val).lstrip('-') if val is not None else None
+
+    @abstractmethod
+    def _build_session(self):
+        """Метод создания сессии для отправки запросов.
+
+        """
+        pass
+
+    @abstractmethod
+    def _send_api_request(self, api_method: str, params: dict, data: dict = None):
+        """Метод отправки запроса к Api VK.
+
+        Args:
+            api_method (str): Метод Api VK.
+            params (dict): Параметры запроса.
+            data (dict, optional): Параметры, передаваемые в теле запроса.
+
+        Returns:
+            :obj:`VkApiResponse`: Ответ или awaitable объект, возвращающий ответ.
+        """
+        pass
+
+    def _get_token(self, api_method: str):
+        """Метод выбора токена для метода Api VK.
+
+        Args:
+            api_method (str): Метод Api VK.
+
+        Returns:
+            token (str): Токен сообщества для методов ``messages`` и ``groups``, иначе токен пользователя.
+        """
+        uses_group_token = self._uses_group_token.get(api_method)
+        if uses_group_token is None:
+            uses_group_token = self._uses_group_token[api_method] = api_method.startswith(('messages', 'groups'))
+        return self.group_token if uses_group_token else self.token
 
     def _get_url(self, api_method: str, params: dict):
         """Метод получения валидного url для отправки запроса.
@@ -43,56 +228,135 @@ class VkApi:
         Returns:
             url (str): Url запроса.
         """
-        p = params.copy()
-        if api_method.startswith('messages') or api_method.startswith('groups'):
-            token = self.group_token
-        else:
-            token = self.token
-        p.update({
+        return VkApiMethods.get_url(api_method, {
             'owner_id': self.owner_id,
-            'access_token': token,
+            'access_token': self._get_token(api_method),
             'v': VkApiMethods.version,
             **params
         })
-        url = VkApiMethods.get_url(api_method, p)
 
-        return url
-
-    def _send_api_request(self, api_method: str, params: dict):
-        """Метод отправки запроса к Api VK.
+    def _get_cache_key(self, api_method: str, params: dict):
+        """Метод получения ключа кэша для запроса.
 
         Args:
             api_method (str): Метод Api VK.
             params (dict): Параметры запроса.
 
         Returns:
-            :obj:`VkApiResponse`: Возвращает объект с телом и кодом ответа.
+            tuple (optional): Ключ кэша или None, если ответ на запрос не кэшируется.
         """
+        if self._cache is None or api_method not in self.cached_methods:
+            return None
+        key = (api_method, self._get_token(api_method), self.owner_id, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
-        if not VkApiMethods.has_method(api_method):
-            return VkApiResponse(
-                {'response': {
-                    'error': 'Метод не существует'
-                }},
-                404
+    def _cache_response(self, key, response: VkApiResponse):
+        """Метод сохранения успешного ответа в кэш.
+
+        Args:
+            key: Ключ кэша, полученный из :meth:`_get_cache_key`.
+            response (:obj:`VkApiResponse`): Ответ на запрос.
+        """
+        if key is not None and response.status_code == 200 and 'error' not in response.body:
+            self._cache.set(key, response)
+
+    def _get_execute_code(self, calls: list) -> str:
+        """Метод формирования кода VKScript для метода ``execute``.
+
+        Args:
+            calls (list): Список кортежей ``(api_method, params)``.
+
+        Returns:
+            code (str): Код, возвращающий массив ответов на переданные запросы.
+        """
+        return 'return [{}];'.format(', '.join(
+            f'API.{api_method}({json.dumps({"owner_id": self.owner_id, **params}, ensure_ascii=False)})'
+            for api_method, params in calls
+        ))
+
+    @staticmethod
+    def _split_execute_response(response: VkApiResponse, count: int) -> list:
+        """Метод разбора ответа метода ``execute`` на ответы отдельных запросов.
+
+        Args:
+            response (:obj:`VkApiResponse`): Ответ метода ``execute``.
+            count (int): Количество запросов в пакете.
+
+        Returns:
+            list: Список объектов :obj:`VkApiResponse`. Если пакет не был выполнен,
+            каждому запросу соответствует отдельная копия общего ответа.
+        """
+        if not isinstance(response.body.get('response'), list):
+            return [VkApiResponse(deepcopy(response.body), response.status_code) for _ in range(count)]
+        errors = iter(response.body.get('execute_errors', ()))
+        return [
+            VkApiResponse(
+                {'response': item} if item is not False else {'error': next(errors, None)},
+                response.status_code
             )
+            for item in response.body['response']
+        ]
 
-        url = self._get_url(api_method, params=params)
-        response = requests.request(
-            method=VkApiMethods.get_http_method(api_method),
-            url=url
+    def _get_execute_chunks(self, calls: list) -> list:
+        """Метод разбиения запросов на пакеты для метода ``execute``.
+
+        Запросы группируются по токену (см. :meth:`_get_token`), т.к. все методы пакета
+        выполняются с токеном, переданным в ``execute``.
+
+        Args:
+            calls (list): Список кортежей ``(api_method, params)``.
+
+        Returns:
+            list: Список кортежей ``(indices, token, chunk)``, где ``indices`` — индексы запросов пакета в ``calls``.
+        """
+        groups = {}
+        for index, (api_method, _) in enumerate(calls):
+            groups.setdefault(self._get_token(api_method), []).append(index)
+        limit = VkApiMethods.execute_limit
+        return [
+            (indices[i:i + limit], token, [calls[index] for index in indices[i:i + limit]])
+            for token, indices in groups.items()
+            for i in range(0, len(indices), limit)
+        ]
+
+    def _send_execute(self, token: str, chunk: list):
+        """Метод отправки пакета запросов через метод ``execute``.
+
+        Код VKScript передаётся в теле запроса, т.к. может превышать допустимую длину url.
+
+        Args:
+            token (str): Токен, с которым выполняются методы пакета.
+            chunk (list): Список кортежей ``(api_method, params)``.
+
+        Returns:
+            :obj:`VkApiResponse`: Ответ метода ``execute``.
+        """
+        return self._send_api_request(
+            VkApiMethods.EXECUTE,
+            params={'access_token': token},
+            data={'code': self._get_execute_code(chunk)}
         )
-        try:
-            response_body = response.json()
-        except JSONDecodeError:
-            return VkApiResponse(
-                {'response': {
-                     'error': 'Сервер не вернул валидный json.'
-                }},
-                502
-            )
 
-        return VkApiResponse(response_body, response.status_code)
+    def _collect_execute_responses(self, count: int, chunks: list, responses: list) -> list:
+        """Метод сборки ответов пакетов в порядке исходных запросов.
+
+        Args:
+            count (int): Количество исходных запросов.
+            chunks (list): Пакеты, полученные из :meth:`_get_execute_chunks`.
+            responses (list): Ответы метода ``execute`` для каждого пакета.
+
+        Returns:
+            list: Список объектов :obj:`VkApiResponse` в порядке исходных запросов.
+        """
+        result = [None] * count
+        for (indices, _, chunk), response in zip(chunks, responses):
+            for index, item in zip(indices, self._split_execute_response(response, len(chunk))):
+                result[index] = item
+        return result
 
     def get_posts(self, params: dict):
         """Метод получения постов.
@@ -224,7 +488,7 @@ class VkApi:
 
         """
 
-        params['random_id'] = random.randint(1, 2**31-1)
+        params = {'random_id': random.getrandbits(31) or 1, **params}
 
         return self._send_api_request(VkApiMethods.SEND_MESSAGE, params=params)
 
@@ -287,17 +551,152 @@ class VkApi:
         return self._send_api_request(VkApiMethods.SAVE_VIDEO, params=params)
 
     def get_callback_confirmation_code(self, params: dict) -> VkApiResponse:
-        params['group_id'] = self.owner_id.strip('-')
+        params['group_id'] = self._group_id
 
         return self._send_api_request(VkApiMethods.GET_CALLBACK_CONFIRMATION_CODE, params=params)
 
     @check_params(required_params=('url', 'title', 'secret_key'))
     def add_callback_server(self, params: dict):
-        params['group_id'] = self.owner_id.strip('-')
+        params['group_id'] = self._group_id
 
         return self._send_api_request(VkApiMethods.ADD_CALLBACK_SERVER, params=params)
 
     def get_callback_servers(self, params: dict):
-        params['group_id'] = self.owner_id.strip('-')
+        params['group_id'] = self._group_id
 
         return self._send_api_request(VkApiMethods.GET_CALLBACK_SERVERS, params=params)
+
+
+class VkApi(BaseVkApi):
+    """Представление взаимодействия с Api VK.
+
+    Запросы отправляются через :obj:`requests.Session` с пулом соединений.
+    Атрибуты описаны в :class:`BaseVkApi`.
+    """
+
+    def __init__(self, owner_id: str, token: str, group_token: str = None, **kwargs):
+        super().__init__(owner_id, token, group_token, **kwargs)
+        self._local = threading.local()
+
+    @property
+    def _batch(self):
+        """
+        :obj:`Batcher` (optional): Накопитель запросов текущего потока (см. :meth:`batch`).
+
+        """
+        return getattr(self._local, 'batch', None)
+
+    @_batch.setter
+    def _batch(self, val):
+        self._local.batch = val
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _build_session(self):
+        """Метод создания сессии для отправки запросов.
+
+        Returns:
+            :obj:`requests.Session`: Сессия с пулом соединений.
+        """
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+        return session
+
+    def close(self):
+        """Метод закрытия сессии и освобождения пула соединений.
+
+        """
+        self._session.close()
+
+    def _send_api_request(self, api_method: str, params: dict, data: dict = None):
+        """Метод отправки запроса к Api VK.
+
+        Args:
+            api_method (str): Метод Api VK.
+            params (dict): Параметры запроса.
+            data (dict, optional): Параметры, передаваемые в теле запроса.
+
+        Returns:
+            :obj:`VkApiResponse`: Возвращает объект с телом и кодом ответа.
+        """
+
+        if self._batch is not None and api_method != VkApiMethods.EXECUTE:
+            return self._batch.add(api_method, params)
+
+        if not VkApiMethods.has_method(api_method):
+            return VkApiResponse(
+                {'response': {
+                    'error': 'Метод не существует'
+                }},
+                404
+            )
+
+        cache_key = self._get_cache_key(api_method, params)
+        if cache_key is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cached
+
+        url = self._get_url(api_method, params=params)
+        response = self._session.request(
+            method=VkApiMethods.get_http_method(api_method),
+            url=url,
+            data=data,
+            timeout=self.timeout
+        )
+        try:
+            response_body = json_loads(response.content)
+        except ValueError:
+            return VkApiResponse(
+                {'response': {
+                     'error': 'Сервер не вернул валидный json.'
+                }},
+                502
+            )
+
+        api_response = VkApiResponse(response_body, response.status_code)
+        self._cache_response(cache_key, api_response)
+
+        return api_response
+
+    def execute(self, calls: list) -> list:
+        """Метод выполнения нескольких методов Api VK одним запросом (см. https://dev.vk.com/method/execute).
+
+        Запросы отправляются пакетами по ``VkApiMethods.execute_limit``,
+        отдельно для методов с токеном пользователя и с токеном сообщества.
+
+        Args:
+            calls (list): Список кортежей ``(api_method, params)``.
+
+        Returns:
+            list: Список объектов :obj:`VkApiResponse` в порядке переданных запросов.
+        """
+        chunks = self._get_execute_chunks(calls)
+        responses = [self._send_execute(token, chunk) for _, token, chunk in chunks]
+        return self._collect_execute_responses(len(calls), chunks, responses)
+
+    @contextmanager
+    def batch(self):
+        """Контекстный менеджер пакетной отправки запросов.
+
+        Внутри блока методы класса не отправляют запрос сразу, а возвращают :obj:`BatchResult`.
+        Накопленные запросы отправляются через ``execute`` при заполнении пакета и при выходе из блока.
+        Пакетный режим действует только в потоке, открывшем блок; вложенный блок использует собственный
+        накопитель и по выходе восстанавливает внешний.
+
+        Если блок завершился исключением, ещё не отправленные запросы отбрасываются,
+        а их :obj:`BatchResult` остаются без ответа.
+
+        Yields:
+            :obj:`Batcher`: Накопитель запросов.
+        """
+        batcher = Batcher(self)
+        outer = self._batch
+        self._batch = batcher
+        try:
+            yield batcher
+        finally:
+            self._batch = outer
+        batcher.flush()